@@ -7,9 +7,10 @@ via github.com blob URLs with ?raw=true, which works for both public and private
 repositories (authenticated users can view images directly).
 
 Usage:
-  pr_assets.py <filepath>
-      Upload a single image to the pr-assets branch.
-      Prints {"url": "https://github.com/{owner}/{repo}/blob/pr-assets/{filename}?raw=true"} to stdout.
+  pr_assets.py <filepath> [<filepath> ...]
+      Upload one or more images to the pr-assets branch (several files go in a single commit).
+      Prints one {"url": "https://github.com/{owner}/{repo}/blob/pr-assets/{filename}?raw=true"}
+      line per file to stdout, in argument order.
 
   pr_assets.py --setup
       Create the pr-assets orphan branch in the current repo (run once per repo).
@@ -22,110 +23,668 @@ Usage:
       Update the ## Screenshots section with placeholder ([Pending]) entries.
       No images are uploaded — the user pastes them manually in the GitHub UI.
 
+  pr_assets.py --daemon
+      Keep a process running for the current checkout that serves uploads and
+      --update-pr over a Unix socket, reusing its token, repo lookup and
+      connections. Other invocations from the same checkout forward to it
+      automatically and fall back to running standalone when it is not up.
+
+  Status messages go to stderr; stdout carries only the JSON url lines.
+
+  Add --no-cache to any command to ignore the cached repo/branch lookups
+  (~/.cache/pr-assets/state.json, 24h) and the short-lived PR body cache
+  (~/.cache/pr-assets/pr-body-<number>.json, 30s).
+
 """
 
+# Annotations stay unevaluated, so modules imported lazily below (http.client)
+# can still be named in type hints.
+from __future__ import annotations
+
 import argparse
-import base64
+import functools
+import hashlib
 import json
 import os
-import re
+import socket
 import subprocess
 import sys
-import tempfile
-import uuid
+import threading
+import time
 from pathlib import Path
+from typing import Callable, Optional, Union
+from urllib.parse import quote
 
 
 # ---------------------------------------------------------------------------
-# GitHub helpers
+# Output
 # ---------------------------------------------------------------------------
 
-def get_repo() -> str:
-    """Return the current repo in 'owner/name' format via gh CLI."""
+def _emit(line: str, stream=None) -> None:
+    """Write one line straight to the stream's binary buffer and flush.
+
+    stdout carries only machine-readable output (the JSON url lines); status
+    messages go to stderr. Any pending text-layer output is flushed first so
+    ordering is preserved.
+    """
+    stream = stream or sys.stdout
+    stream.flush()
+    stream.buffer.write(line.encode() + b"\n")
+    stream.buffer.flush()
+
+
+def _status(line: str) -> None:
+    """Show a status line on stderr (the default for functions taking a status callback)."""
+    _emit(line, sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# GitHub REST transport
+# ---------------------------------------------------------------------------
+
+GITHUB_API_HOST = "api.github.com"
+
+# Idle keep-alive HTTPS connections, reused across REST calls (and across
+# threads in --daemon mode)
+MAX_IDLE_CONNECTIONS = 4
+# Idle connections older than this are closed rather than reused, since the
+# server may have dropped them in the meantime (matters for --daemon)
+KEEPALIVE_EXPIRY_SECONDS = 30
+# Methods safe to resend when a reused connection turns out to be dead
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+GITHUB_API_URL = f"https://{GITHUB_API_HOST}"
+REDIRECT_STATUSES = frozenset({301, 302, 307, 308})
+MAX_REDIRECTS = 3
+_idle_connections: list[tuple[http.client.HTTPSConnection, float]] = []
+_pool_lock = threading.Lock()
+
+
+class GitHubError(Exception):
+    """A GitHub API call failed.
+
+    status is the HTTP status code and api_message GitHub's own error message
+    (the reply's "message" field), when known.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, api_message: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.api_message = api_message
+
+    @property
+    def is_missing_branch(self) -> bool:
+        """True when the failure means the target branch does not exist (yet).
+
+        Only GitHub's message is matched for a 422 ("Branch pr-assets not
+        found"); the full error text also holds the repo slug and filename.
+        """
+        message = self.api_message.lower()
+        return self.status == 404 or (
+            self.status == 422 and message.startswith("branch ") and message.endswith("not found")
+        )
+
+
+def _gh(*args: str, input: Optional[Union[str, bytes]] = None) -> str:
+    """Run a gh command and return its stdout.
+
+    Raises CalledProcessError on failure; main() reports it. stderr is kept as
+    bytes and only decoded when an error is actually shown.
+    """
     result = subprocess.run(
-        ["gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
+        ["gh", *args],
+        input=input.encode() if isinstance(input, str) else input,
         capture_output=True,
-        text=True,
+        check=True,
     )
-    if result.returncode != 0:
-        print(
-            "Error: could not determine current repo. Make sure `gh` is authenticated (`gh auth status`).",
-            file=sys.stderr,
+    return result.stdout.decode()
+
+
+def _gh_stderr(error: subprocess.CalledProcessError) -> str:
+    return (error.stderr or b"").decode(errors="replace")
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_token() -> Optional[str]:
+    """Return a GitHub token from GH_TOKEN/GITHUB_TOKEN or `gh auth token` (looked up once).
+
+    Without a token (or outside github.com, see _use_rest) every helper
+    shells out to `gh` instead.
+    """
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        if os.environ.get(var):
+            return os.environ[var]
+    try:
+        return _gh("auth", "token").strip() or None
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+def _acquire_connection(fresh: bool = False) -> tuple[http.client.HTTPSConnection, bool]:
+    """Return (connection, reused): the most recent live idle one, else a new one."""
+    now = time.monotonic()
+    with _pool_lock:
+        while _idle_connections and not fresh:
+            conn, idle_since = _idle_connections.pop()
+            if now - idle_since < KEEPALIVE_EXPIRY_SECONDS:
+                return conn, True
+            conn.close()
+    import http.client  # pulls in ssl/email; skipped by gh-fallback and daemon-client runs
+
+    return http.client.HTTPSConnection(GITHUB_API_HOST, timeout=60), False
+
+
+def _release_connection(conn: http.client.HTTPSConnection) -> None:
+    with _pool_lock:
+        if len(_idle_connections) < MAX_IDLE_CONNECTIONS:
+            _idle_connections.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
+def _github_request(method: str, endpoint: str, payload: Optional[dict] = None) -> tuple[int, bytes]:
+    """Send one request over a pooled connection and return (status, raw body).
+
+    Read redirects within the API are followed: a renamed or transferred repo
+    answers its old slug with a 301 instead of the resource. Writes are never
+    redirected; their 3xx statuses are returned for the caller to reject.
+
+    Callers must only use this when _use_rest() is True (the repo resolver
+    also does, before the repo is known, for a github.com remote with a token).
+    """
+    headers = {
+        "Authorization": f"Bearer {_gh_token()}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "pr-assets",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    body = None
+    if payload is not None:
+        # Sent chunk by chunk, so base64 file content is never copied into one big body
+        body = _json_chunks(payload)
+        headers["Content-Type"] = "application/json"
+        headers["Content-Length"] = str(sum(map(len, body)))
+
+    # Accept gh-style endpoints such as "graphql" as well as "/repos/..."
+    path = "/" + endpoint.lstrip("/")
+    for _ in range(MAX_REDIRECTS + 1):
+        response, data = _send_request(method, path, body, headers)
+        location = response.getheader("Location") or ""
+        if not (
+            method in IDEMPOTENT_METHODS
+            and response.status in REDIRECT_STATUSES
+            and location.startswith(GITHUB_API_URL + "/")
+        ):
+            break
+        path = location[len(GITHUB_API_URL):]
+    return response.status, data
+
+
+def _send_request(
+    method: str, path: str, body: Optional[list[bytes]], headers: dict
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """Send one request and read the full response, retrying a stale reused connection."""
+    import http.client
+
+    conn, reused = _acquire_connection()
+    while True:
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            if not (reused and method in IDEMPOTENT_METHODS):
+                raise GitHubError(f"{method} {path} failed: {e}") from e
+            # The server closed this kept-alive connection while it sat idle
+            conn, reused = _acquire_connection(fresh=True)
+    _release_connection(conn)
+    return response, data
+
+
+# Stands in for a bytes value while the rest of a payload is serialised
+_BLOB_MARKER = json.dumps("\0pr-assets-blob\0")
+
+
+def _json_chunks(payload: dict) -> list[bytes]:
+    """Serialise payload as JSON, returned as a list of byte chunks.
+
+    bytes values (base64 file content) are spliced in as-is rather than
+    decoded to str and escaped, so no extra full-size copy of an upload is
+    made. Base64 never needs JSON escaping.
+    """
+    blobs: list[bytes] = []
+
+    def splice(value: object) -> str:
+        if isinstance(value, (bytes, bytearray)):
+            blobs.append(value)
+            return json.loads(_BLOB_MARKER)
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+    parts = json.dumps(payload, default=splice).split(_BLOB_MARKER)
+    chunks = [parts[0].encode()]
+    for blob, part in zip(blobs, parts[1:]):
+        chunks += [b'"', blob, b'"' + part.encode()]
+    return chunks
+
+
+def _github_rest(method: str, endpoint: str, payload: Optional[dict] = None) -> dict:
+    """Call the GitHub REST API directly and return the parsed JSON response."""
+    status, data = _github_request(method, endpoint, payload)
+    # Anything but 2xx is a failure: a 3xx left over from a write to a renamed
+    # repo's old slug means the change was never applied
+    if not 200 <= status < 300:
+        raise GitHubError(
+            f"{method} {endpoint} failed (HTTP {status}):\n{data.decode(errors='replace')}",
+            status,
+            _api_message(data),
         )
-        sys.exit(1)
-    return result.stdout.strip()
+    return json.loads(data) if data else {}
 
 
-def branch_exists(repo: str, branch: str) -> bool:
-    """Return True if the given branch exists in the repo."""
+def _api_message(data: bytes) -> str:
+    """Return the "message" field of a GitHub error reply, or "" if there is none."""
+    try:
+        reply = json.loads(data)
+    except ValueError:
+        return ""
+    message = reply.get("message") if isinstance(reply, dict) else None
+    return message if isinstance(message, str) else ""
+
+
+# ---------------------------------------------------------------------------
+# Local caches
+# ---------------------------------------------------------------------------
+
+# Set from --no-cache: skip reading and writing every on-disk cache
+CACHE_ENABLED = True
+
+# The repo slug and pr-assets branch existence rarely change, so they are
+# remembered per checkout across invocations.
+STATE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write JSON via a temp file + rename so a concurrent reader never sees a torn file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "pr-assets"
+
+
+def _state_path() -> Path:
+    return _cache_dir() / "state.json"
+
+
+def _read_state_file() -> dict:
+    try:
+        with _state_path().open("rb") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _is_fresh(entry: object) -> bool:
+    return isinstance(entry, dict) and time.time() - entry.get("ts", 0) < STATE_TTL_SECONDS
+
+
+def _load_state() -> dict:
+    """Return the cached state for the current checkout, or {} if missing, stale or disabled."""
+    if not CACHE_ENABLED:
+        return {}
+    entry = _read_state_file().get(os.getcwd())
+    return entry if _is_fresh(entry) else {}
+
+
+def _save_state(**fields) -> None:
+    """Merge fields into the current checkout's cached state (dropping stale entries)."""
+    if not CACHE_ENABLED:
+        return
+    state = {key: entry for key, entry in _read_state_file().items() if _is_fresh(entry)}
+    cwd = os.getcwd()
+    state[cwd] = {**state.get(cwd, {}), **fields, "ts": time.time()}
+    _write_json_atomic(_state_path(), state)
+
+
+# ---------------------------------------------------------------------------
+# GitHub helpers
+# ---------------------------------------------------------------------------
+
+def _parse_github_remote(url: str) -> Optional[str]:
+    """Return 'owner/name' for a github.com remote URL (https, ssh or scp-style), else None."""
+    for prefix in ("https://github.com/", "ssh://git@github.com/", "git@github.com:"):
+        if url.startswith(prefix):
+            slug = url[len(prefix):].rstrip("/")
+            if slug.endswith(".git"):
+                slug = slug[:-4]
+            if slug.count("/") == 1:
+                return slug
+    return None
+
+
+def _repo_from_git_config() -> Optional[str]:
+    """Resolve the repo from local git config, the same way `gh` picks its base repo.
+
+    Uses the remote marked by `gh repo set-default` (gh-resolved) when present,
+    otherwise the only configured remote. Returns None when ambiguous or when
+    that remote is not on github.com (e.g. GitHub Enterprise), so the caller
+    can defer to `gh`, which knows the right host.
+    """
     result = subprocess.run(
-        ["gh", "api", f"/repos/{repo}/branches/{branch}"],
+        ["git", "config", "--get-regexp", r"^remote\..*\.(url|gh-resolved)$"],
         capture_output=True,
+        text=True,
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        return None
+
+    urls: dict[str, str] = {}
+    resolved: Optional[tuple[str, str]] = None  # (remote name, gh-resolved value)
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        name, _, field = key[len("remote."):].rpartition(".")
+        if field == "url":
+            urls[name] = value
+        elif resolved is None:
+            resolved = (name, value)
+
+    if resolved is not None:
+        name, value = resolved
+        slug = _parse_github_remote(urls.get(name, ""))
+        # "base" picks the remote's own repo; anything else names another repo on its host
+        return value if slug and value != "base" and "/" in value else slug
+    if len(urls) == 1:
+        return _parse_github_remote(next(iter(urls.values())))
+    return None
 
 
-def create_pr_assets_branch(repo: str) -> None:
-    """Create an orphan 'pr-assets' branch via the GitHub API (no local git needed)."""
-    print(f"Creating orphan branch 'pr-assets' in {repo}...")
+def get_repo() -> str:
+    """Return the current repo in 'owner/name' format (cached per checkout)."""
+    return _repo_info()[0]
+
+
+def _use_rest() -> bool:
+    """True when API calls can go straight to api.github.com instead of through `gh`.
+
+    That needs a token and a repo known to live on github.com; `gh` alone
+    knows which host a GitHub Enterprise checkout (or GH_HOST) points at.
+    """
+    return bool(_gh_token()) and not os.environ.get("GH_HOST") and _repo_info()[1]
+
+
+@functools.lru_cache(maxsize=1)
+def _repo_info() -> tuple[str, bool]:
+    """Return (repo, on_github_com) for the current checkout (cached per checkout)."""
+    state = _load_state()
+    if state.get("repo") and "github_com" in state:
+        return state["repo"], state["github_com"]
+    repo, github_com = _resolve_repo()
+    _save_state(repo=repo, github_com=github_com)
+    return repo, github_com
+
+
+def _resolve_repo() -> tuple[str, bool]:
+    """Read the repo from local git config when possible; fall back to `gh repo view`.
+
+    Returns (repo, on_github_com). Only a github.com remote is read locally;
+    any other host is left to `gh`, and marked as not on github.com.
+
+    A remote keeps the old name after the repo is renamed or transferred, and
+    GitHub only redirects reads of that name, so a slug from git config is
+    confirmed against the API's canonical full_name before it is used (and cached).
+    """
+    repo = None if os.environ.get("GH_HOST") else _repo_from_git_config()
+    if repo:
+        endpoint = f"/repos/{repo}"
+        reply = _github_rest("GET", endpoint) if _gh_token() else _gh_cli_api("GET", endpoint)
+        canonical = reply.get("full_name")
+        if not isinstance(canonical, str) or canonical.count("/") != 1:
+            raise GitHubError(f"GET /repos/{repo} returned no full_name")
+        return canonical, True
+
+    try:
+        return _gh("repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner").strip(), False
+    except subprocess.CalledProcessError as e:
+        raise GitHubError(
+            "could not determine current repo. Make sure `gh` is authenticated (`gh auth status`)."
+        ) from e
+
+
+def branch_exists(repo: str, branch: str) -> bool:
+    """Return True if the given branch exists in the repo.
+
+    Only positive answers are cached: a missing branch is expected to be created next.
+    """
+    state = _load_state()
+    if state.get("repo") == repo and branch in state.get("branches", []):
+        return True
+
+    if _use_rest():
+        status, _ = _github_request("GET", f"/repos/{repo}/branches/{branch}")
+        exists = status == 200
+    else:
+        try:
+            _gh("api", f"/repos/{repo}/branches/{branch}")
+            exists = True
+        except subprocess.CalledProcessError:
+            exists = False
+
+    if exists:
+        _remember_branch(repo, branch)
+    return exists
+
+
+def _remember_branch(repo: str, branch: str) -> None:
+    state = _load_state()
+    branches = state.get("branches", []) if state.get("repo") == repo else []
+    if branch not in branches:
+        _save_state(repo=repo, branches=[*branches, branch])
+
+
+def create_pr_assets_branch(repo: str, status: Callable[[str], None] = _status) -> None:
+    """Create an orphan 'pr-assets' branch via the GitHub API (no local git needed).
+
+    Progress lines go to status (stderr by default).
+    """
+    status(f"Creating orphan branch 'pr-assets' in {repo}...")
 
     readme = (
-        b"# PR Assets\n\n"
-        b"Screenshots hosted here for PR descriptions. "
-        b"**Never merge this branch** - it has no shared history with main/develop.\n"
+        "# PR Assets\n\n"
+        "Screenshots hosted here for PR descriptions. "
+        "**Never merge this branch** - it has no shared history with main/develop.\n"
     )
-    readme_b64 = base64.b64encode(readme).decode()
-
-    # 1. Create a blob for the README
-    blob = _gh_api("POST", f"/repos/{repo}/git/blobs", {
-        "content": readme_b64,
-        "encoding": "base64",
-    })
-    blob_sha = blob["sha"]
 
-    # 2. Create a tree pointing to the blob
+    # 1. Create a tree with the README inlined (GitHub writes the blob itself,
+    #    saving a separate blob round-trip)
     tree = _gh_api("POST", f"/repos/{repo}/git/trees", {
-        "tree": [{"path": "README.md", "mode": "100644", "type": "blob", "sha": blob_sha}],
+        "tree": [{"path": "README.md", "mode": "100644", "type": "blob", "content": readme}],
     })
     tree_sha = tree["sha"]
 
-    # 3. Create an orphan commit (no 'parents' key = root commit)
+    # 2. Create an orphan commit (no 'parents' key = root commit)
     commit = _gh_api("POST", f"/repos/{repo}/git/commits", {
         "message": "chore: init pr-assets branch for PR screenshots",
         "tree": tree_sha,
     })
     commit_sha = commit["sha"]
 
-    # 4. Create the branch reference
+    # 3. Create the branch reference
     _gh_api("POST", f"/repos/{repo}/git/refs", {
         "ref": "refs/heads/pr-assets",
         "sha": commit_sha,
     })
 
-    print("Branch 'pr-assets' created successfully.")
+    _remember_branch(repo, "pr-assets")
+    status("Branch 'pr-assets' created successfully.")
 
 
-def _gh_api(method: str, endpoint: str, payload: dict) -> dict:
-    """Call `gh api` with a JSON payload and return the parsed response."""
-    result = subprocess.run(
-        ["gh", "api", "--method", method, endpoint, "--input", "-"],
-        input=json.dumps(payload),
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error: gh api {method} {endpoint} failed:\n{result.stderr}", file=sys.stderr)
-        sys.exit(1)
-    return json.loads(result.stdout)
+def _gh_api(method: str, endpoint: str, payload: Optional[dict] = None) -> dict:
+    """Call a GitHub REST endpoint with an optional JSON payload and return the parsed response.
+
+    Goes straight to the API when _use_rest() allows it, otherwise through `gh api`.
+    """
+    if _use_rest():
+        return _github_rest(method, endpoint, payload)
+    return _gh_cli_api(method, endpoint, payload)
+
+
+def _gh_cli_api(method: str, endpoint: str, payload: Optional[dict] = None) -> dict:
+    """The `gh api` path of _gh_api; gh picks the host and token itself."""
+    args = ["api", "--method", method, endpoint]
+    stdin = None
+    if payload is not None and _fits_field_flags(payload):
+        # Small string-only payloads go as -f flags: no JSON round-trip through stdin
+        for key, value in payload.items():
+            args += ["-f", f"{key}={value}"]
+    elif payload is not None:
+        args += ["--input", "-"]
+        stdin = b"".join(_json_chunks(payload))
+    try:
+        return json.loads(_gh(*args, input=stdin))
+    except subprocess.CalledProcessError as e:
+        stderr = _gh_stderr(e)
+        raise GitHubError(
+            f"gh api {method} {endpoint} failed:\n{stderr}",
+            _gh_http_status(stderr),
+            _gh_api_message(stderr),
+        ) from e
+
+
+# Longest value passed on the gh command line; anything bigger (e.g. base64
+# file content) is sent as a JSON body on stdin instead
+MAX_FIELD_FLAG_LENGTH = 1024
+
+
+def _fits_field_flags(payload: dict) -> bool:
+    return all(isinstance(value, str) and len(value) <= MAX_FIELD_FLAG_LENGTH for value in payload.values())
+
+
+def _gh_http_status(stderr: str) -> Optional[int]:
+    """Extract the status from gh's "... (HTTP 404)" error output."""
+    i = stderr.rfind("(HTTP ")
+    if i < 0:
+        return None
+    code = stderr[i + len("(HTTP "):].partition(")")[0]
+    return int(code) if code.isdigit() else None
+
 
+def _gh_api_message(stderr: str) -> str:
+    """Extract GitHub's message from gh's "gh: <message> (HTTP 422)" error line."""
+    for line in stderr.splitlines():
+        message, sep, _ = line.rpartition(" (HTTP ")
+        if sep:
+            return message[len("gh: "):] if message.startswith("gh: ") else message
+    return ""
+
+
+# Read size for base64 encoding; a multiple of 3 so chunks encode without padding
+B64_CHUNK_SIZE = 57 * 1024
+
+# Bytes of BLAKE2b digest in asset filenames (12 hex chars)
+CONTENT_HASH_SIZE = 6
+
+
+def _encode_asset(filepath: str) -> tuple[str, str, bytearray]:
+    """Read a file once and return (content-addressed filename, git blob SHA, base64 content).
+
+    Encodes chunk by chunk into a buffer sized up front, so the raw file is
+    never held in memory and the encoding is never copied: the buffer is what
+    goes into the request body (see _json_chunks). The blob SHA is what GitHub
+    reports as the file's "sha", so an existing upload can be recognised
+    without comparing content.
+    """
+    import base64
+
+    digest = hashlib.blake2b(digest_size=CONTENT_HASH_SIZE)
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        blob_sha = hashlib.sha1(f"blob {size}\0".encode())
+        encoded = bytearray(4 * ((size + 2) // 3))
+        end = 0
+        while chunk := f.read(B64_CHUNK_SIZE):
+            digest.update(chunk)
+            blob_sha.update(chunk)
+            piece = base64.b64encode(chunk)
+            encoded[end:end + len(piece)] = piece
+            end += len(piece)
+    del encoded[end:]  # only if the file shrank while it was read
+    stem, suffix = os.path.splitext(os.path.basename(filepath))
+    return f"{stem}-{digest.hexdigest()}{suffix}", blob_sha.hexdigest(), encoded
+
+
+def _existing_blob_sha(repo: str, filename: str) -> Optional[str]:
+    """Return the blob SHA of filename on the pr-assets branch, or None if it is not there.
+
+    Only a 404 means "not there"; any other reply without a SHA raises, so a
+    malformed answer never lets the upload go ahead.
+    """
+    try:
+        existing = _gh_api("GET", f"/repos/{repo}/contents/{quote(filename)}?ref=pr-assets")
+    except GitHubError as e:
+        if e.status == 404:
+            return None
+        raise
+    sha = existing.get("sha") if isinstance(existing, dict) else None
+    if not isinstance(sha, str) or not sha:
+        raise GitHubError(f"unexpected reply for '{filename}' on pr-assets: no blob SHA")
+    return sha
+
+
+def _resolve_asset_name(
+    filepath: str, filename: str, blob_sha: str, lookup: Callable[[str], Optional[str]]
+) -> tuple[str, bool]:
+    """Pick the name to store the file under; returns (filename, already_uploaded).
+
+    lookup maps a filename to its blob SHA on pr-assets (None when absent).
+    A file with the same name and blob SHA is the same screenshot, so it is
+    reused. A same-named file with other content (a short-hash collision)
+    makes the upload fall back to a name carrying the full blob SHA.
+    """
+    stem, suffix = os.path.splitext(os.path.basename(filepath))
+    for candidate in (filename, f"{stem}-{blob_sha}{suffix}"):
+        existing = lookup(candidate)
+        if existing is None:
+            return candidate, False
+        if existing == blob_sha:
+            return candidate, True
+    raise GitHubError(f"'{candidate}' already exists on pr-assets with different content")
+
+
+def _tree_lookup(repo: str, commit_sha: str) -> Callable[[str], Optional[str]]:
+    """Fetch the top-level tree of a pr-assets commit once and return a filename -> blob SHA lookup.
+
+    Falls back to per-file Contents lookups if GitHub truncated the listing.
+    """
+    tree = _gh_api("GET", f"/repos/{repo}/git/trees/{commit_sha}")
+    blobs = {
+        entry["path"]: entry["sha"]
+        for entry in tree.get("tree", [])
+        if entry.get("type") == "blob"
+    }
+    if tree.get("truncated"):
+        return lambda filename: blobs.get(filename) or _existing_blob_sha(repo, filename)
+    return blobs.get
 
 
 def upload_to_github(filepath: str, repo: str) -> str:
     """
     Upload a file to the pr-assets branch via the GitHub Contents API.
 
-    Generates a unique filename using a short UUID suffix to guarantee
-    no collisions with existing files (e.g. screenshot-a1b2c3d4.png).
+    The filename carries a short BLAKE2b hash of the content
+    (e.g. screenshot-1a2b3c4d5e6f.png). If that file already exists with the
+    same git blob SHA, the same screenshot was uploaded before: its URL is
+    reused and the PUT is skipped entirely.
 
     Returns a github.com blob URL with ?raw=true, which works for both
     public and private repos. Authenticated users viewing the PR on
@@ -136,13 +695,12 @@ def upload_to_github(filepath: str, repo: str) -> str:
     because GitHub's markdown renderer proxies images through its camo CDN,
     which cannot authenticate to fetch private repo content.
     """
-    stem = Path(filepath).stem
-    suffix = Path(filepath).suffix
-    short_id = uuid.uuid4().hex[:8]
-    filename = f"{stem}-{short_id}{suffix}"
-
-    with open(filepath, "rb") as f:
-        content_b64 = base64.b64encode(f.read()).decode()
+    filename, blob_sha, content_b64 = _encode_asset(filepath)
+    filename, uploaded = _resolve_asset_name(
+        filepath, filename, blob_sha, functools.partial(_existing_blob_sha, repo)
+    )
+    if uploaded:
+        return _asset_url(repo, filename)
 
     payload: dict = {
         "message": f"chore: add PR screenshot {filename}",
@@ -150,19 +708,107 @@ def upload_to_github(filepath: str, repo: str) -> str:
         "branch": "pr-assets",
     }
 
-    _gh_api("PUT", f"/repos/{repo}/contents/{filename}", payload)
+    _gh_api("PUT", f"/repos/{repo}/contents/{quote(filename)}", payload)
+
+    return _asset_url(repo, filename)
+
+
+MAX_PARALLEL_ENCODES = 8
+
+CREATE_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) { commit { oid } }
+}
+"""
+
+
+def upload_many_to_github(filepaths: list[str], repo: str) -> list[str]:
+    """
+    Upload several files to the pr-assets branch in a single commit.
+
+    Uses the GraphQL createCommitOnBranch mutation, so N files cost a ref
+    and a tree lookup plus one mutation instead of N Contents API commits.
+    File reads and base64 encoding overlap with the lookups. Files already
+    in the head commit's tree (same name and blob SHA) are skipped; that is
+    the same snapshot expectedHeadOid pins the commit to. Returns the URLs
+    in the same order as filepaths.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Read + encode the files in the background while the head ref and tree are fetched
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_ENCODES, len(filepaths))) as pool:
+        encoded = pool.map(_encode_asset, filepaths)
+        head_sha = _gh_api("GET", f"/repos/{repo}/git/ref/heads/pr-assets")["object"]["sha"]
+        lookup = _tree_lookup(repo, head_sha)
+        assets = list(encoded)
+
+    filenames = []
+    additions: dict[str, bytearray] = {}
+    for filepath, (filename, blob_sha, contents) in zip(filepaths, assets):
+        filename, uploaded = _resolve_asset_name(filepath, filename, blob_sha, lookup)
+        filenames.append(filename)
+        if not uploaded:
+            additions[filename] = contents  # identical files in one batch collapse to one entry
 
-    return f"https://github.com/{repo}/blob/pr-assets/{filename}?raw=true"
+    if additions:
+        result = _gh_api("POST", "graphql", {
+            "query": CREATE_COMMIT_MUTATION,
+            "variables": {"input": {
+                "branch": {"repositoryNameWithOwner": repo, "branchName": "pr-assets"},
+                "message": {"headline": f"chore: add {len(additions)} PR screenshots"},
+                "fileChanges": {"additions": [
+                    {"path": filename, "contents": contents} for filename, contents in additions.items()
+                ]},
+                "expectedHeadOid": head_sha,
+            }},
+        })
+        if result.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in result["errors"])
+            raise GitHubError(f"createCommitOnBranch failed: {messages}")
+
+    return [_asset_url(repo, filename) for filename in filenames]
+
+
+# Commits to pr-assets must not race each other (the daemon serves clients in parallel)
+_upload_lock = threading.Lock()
+
+
+def upload_files(filepaths: list[str], repo: str, status: Callable[[str], None] = _status) -> list[str]:
+    """Upload one or more files to pr-assets, creating the branch if needed.
+
+    Uploads straight away: the branch almost always exists, so checking first
+    would cost a round-trip on every run. The branch is created only if the
+    upload reports it missing, then the upload is retried once. Status lines
+    about that go to status (stderr by default).
+    """
+    with _upload_lock:
+        try:
+            return _upload(filepaths, repo)
+        except GitHubError as e:
+            if not e.is_missing_branch:
+                raise
+            status(f"Branch 'pr-assets' not found in {repo}. Creating it automatically...")
+            create_pr_assets_branch(repo, status)
+            return _upload(filepaths, repo)
+
+
+def _upload(filepaths: list[str], repo: str) -> list[str]:
+    if len(filepaths) == 1:
+        return [upload_to_github(filepaths[0], repo)]
+    return upload_many_to_github(filepaths, repo)
+
+
+def _asset_url(repo: str, filename: str) -> str:
+    return f"https://github.com/{repo}/blob/pr-assets/{quote(filename)}?raw=true"
 
 
 # ---------------------------------------------------------------------------
 # PR update
 # ---------------------------------------------------------------------------
 
-SCREENSHOTS_PATTERN = re.compile(
-    r"(?im)^##\s+screenshots\b.*?(?=\n##\s|\Z)",
-    re.DOTALL,
-)
+SCREENSHOTS_TITLE = "screenshots"
+
+PENDING_PLACEHOLDER = "> 📸 _[Pending] — paste the screenshot here._"
 
 
 def build_screenshots_section(entries: list[tuple[str, str]]) -> str:
@@ -171,54 +817,295 @@ def build_screenshots_section(entries: list[tuple[str, str]]) -> str:
     When url is empty/None, the entry renders as a [Pending] placeholder so the
     user can paste the image manually in the GitHub UI.
     """
-    lines = ["## Screenshots", ""]
-    for i, (label, url) in enumerate(entries, start=1):
-        lines.append(f"### {i}. {label}")
-        if url:
-            lines.append(f"![{label}]({url})")
-        else:
-            lines.append("> 📸 _[Pending] — paste the screenshot here._")
-        lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+    body = "".join(
+        f"### {i}. {label}\n{f'![{label}]({url})' if url else PENDING_PLACEHOLDER}\n\n"
+        for i, (label, url) in enumerate(entries, start=1)
+    )
+    return f"## Screenshots\n\n{body}".rstrip() + "\n"
 
 
-def update_pr(pr_number: str, entries: list[tuple[str, str]]) -> None:
-    """Fetch current PR body, replace/append ## Screenshots section, update via gh."""
-    result = subprocess.run(
-        ["gh", "pr", "view", pr_number, "--json", "body", "-q", ".body"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error: could not fetch PR #{pr_number}: {result.stderr}", file=sys.stderr)
-        sys.exit(1)
+# What may follow "##" for a line to be a level-2 heading (an empty "##" counts too)
+HEADING_SEPARATORS = " \t\r\n"
+
+
+def _is_heading(body: str, i: int) -> bool:
+    """True when a '##' heading (not '###' or '##foo') starts at index i."""
+    return body.startswith("##", i) and (i + 2 == len(body) or body[i + 2] in HEADING_SEPARATORS)
+
+
+def _next_heading(body: str, pos: int) -> int:
+    """Return the index of the next line-initial '##' heading after pos, or -1."""
+    i = body.find("\n##", pos)
+    while i >= 0 and not _is_heading(body, i + 1):
+        i = body.find("\n##", i + 1)
+    return i + 1 if i >= 0 else -1
+
+
+def _find_screenshots_section(body: str) -> Optional[tuple[int, int]]:
+    """Return the (start, end) span of the ## Screenshots section, or None.
+
+    The section runs from its heading up to the next '##' heading (or the end
+    of the body). Any run of spaces or tabs may follow the '##'. Plain
+    str.find scans keep this linear on long PR bodies.
+    """
+    start = 0 if _is_heading(body, 0) else _next_heading(body, 0)
+    while start >= 0:
+        title = start + 2
+        while body[title:title + 1] in (" ", "\t"):
+            title += 1
+        title_end = title + len(SCREENSHOTS_TITLE)
+        after = body[title_end:title_end + 1]
+        if (
+            title > start + 2
+            and body[title:title_end].lower() == SCREENSHOTS_TITLE
+            and not (after.isalnum() or after == "_")
+        ):
+            end = _next_heading(body, start)
+            return start, len(body) if end < 0 else end
+        start = _next_heading(body, start)
+    return None
+
+
+def replace_screenshots_section(body: str, section: str) -> tuple[str, bool]:
+    """Replace the ## Screenshots section of body with section.
+
+    Returns (new_body, replaced); when no Screenshots section exists, body is
+    returned unchanged with replaced=False.
+    """
+    span = _find_screenshots_section(body)
+    if span is None:
+        return body, False
+    start, end = span
+    # Keep the blank lines that separated the old section from the next heading
+    old = body[start:end]
+    trailing = old[len(old.rstrip("\n")):]
+    return body[:start] + section.rstrip("\n") + trailing + body[end:], True
+
+
+# Back-to-back updates from one skill run reuse the body written by the previous
+# update instead of fetching it again from GitHub.
+PR_CACHE_TTL_SECONDS = 30
+
+
+def _pr_cache_path(pr_number: str) -> Path:
+    # Kept in the user's cache dir, not the shared temp dir: its content is
+    # written back as the PR body
+    return _cache_dir() / f"pr-body-{pr_number}.json"
+
+
+def _read_cached_pr_body(pr_number: str) -> Optional[str]:
+    """Return the cached body for this PR if it is fresh and from the same checkout."""
+    if not CACHE_ENABLED:
+        return None
+    path = _pr_cache_path(pr_number)
+    try:
+        if time.time() - path.stat().st_mtime >= PR_CACHE_TTL_SECONDS:
+            return None
+        with path.open("rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("cwd") != os.getcwd():
+        return None
+    body = cached.get("body")
+    return body if isinstance(body, str) else None
+
+
+def _write_cached_pr_body(pr_number: str, body: str) -> None:
+    if CACHE_ENABLED:
+        _write_json_atomic(_pr_cache_path(pr_number), {"cwd": os.getcwd(), "body": body})
+
+
+def _invalidate_cached_pr_body(pr_number: str) -> None:
+    try:
+        _pr_cache_path(pr_number).unlink()
+    except OSError:
+        pass
+
+
+def _fetch_pr_body(pr_number: str) -> str:
+    """Return the PR body via the REST API, or via `gh pr view` when _use_rest() is False."""
+    if _use_rest():
+        pr = _github_rest("GET", f"/repos/{get_repo()}/pulls/{pr_number}")
+        return (pr.get("body") or "").rstrip("\n")
+
+    try:
+        return _gh("pr", "view", pr_number, "--json", "body", "-q", ".body").rstrip("\n")
+    except subprocess.CalledProcessError as e:
+        raise GitHubError(f"could not fetch PR #{pr_number}: {_gh_stderr(e)}") from e
+
+
+def _set_pr_body(pr_number: str, body: str) -> None:
+    """Replace the PR body via the REST API, or via `gh pr edit` when _use_rest() is False."""
+    if _use_rest():
+        _github_rest("PATCH", f"/repos/{get_repo()}/pulls/{pr_number}", {"body": body})
+        return
+
+    # `--body-file -` reads the body from stdin, so no temp file is needed
+    _gh("pr", "edit", pr_number, "--body-file", "-", input=body)
+
+
+def update_pr(pr_number: str, entries: list[tuple[str, str]]) -> str:
+    """Fetch current PR body, replace/append ## Screenshots section, and write it back.
+
+    Returns the status line to show the user.
+    """
+    current_body = _read_cached_pr_body(pr_number)
+    if current_body is None:
+        current_body = _fetch_pr_body(pr_number)
 
-    current_body = result.stdout.rstrip("\n")
     new_section = build_screenshots_section(entries)
 
-    if SCREENSHOTS_PATTERN.search(current_body):
-        new_body = SCREENSHOTS_PATTERN.sub(new_section.rstrip("\n"), current_body)
-    else:
+    new_body, replaced = replace_screenshots_section(current_body, new_section)
+    if not replaced:
         separator = "\n\n" if current_body and not current_body.endswith("\n\n") else ""
         new_body = current_body + separator + new_section
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
-        tmp.write(new_body)
-        tmp_path = tmp.name
+    # Drop the cache first so a failed update never leaves a stale body behind
+    _invalidate_cached_pr_body(pr_number)
+    _set_pr_body(pr_number, new_body)
+    _write_cached_pr_body(pr_number, new_body.rstrip("\n"))
+    return f"PR #{pr_number} description updated with {len(entries)} screenshot(s)."
 
+
+# ---------------------------------------------------------------------------
+# Daemon mode
+# ---------------------------------------------------------------------------
+
+def _socket_path() -> Path:
+    """Return the daemon socket for the current checkout.
+
+    One daemon per checkout keeps its repo lookup and caches (keyed on the
+    working directory) identical to what a standalone run would use.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if not base:
+        import tempfile  # only needed without a runtime dir
+
+        base = tempfile.gettempdir()
+    checkout = hashlib.blake2b(os.getcwd().encode(), digest_size=4).hexdigest()
+    return Path(base) / f"pr-assets-{checkout}.sock"
+
+
+def _handle_request(request: dict, status: list[str]) -> list[str]:
+    """Run one daemon request; return the stdout lines a standalone run would write.
+
+    The stderr lines it would write (e.g. branch creation) are appended to
+    status, so the client shows them rather than the daemon's own stderr.
+    """
+    op = request.get("op")
+    if op == "ping":
+        return []
+    if op == "upload":
+        urls = upload_files(request["paths"], get_repo(), status.append)
+        return [json.dumps({"url": url}) for url in urls]
+    if op == "update_pr":
+        entries = [(label, url) for label, url in request["entries"]]
+        status.append(update_pr(str(request["number"]), entries))
+        return []
+    raise ValueError(f"unknown op {op!r}")
+
+
+def serve_daemon() -> None:
+    """Listen on the checkout's socket until interrupted, keeping auth and connections warm."""
+    import socketserver  # only the daemon itself needs it
+
+    class _DaemonHandler(socketserver.StreamRequestHandler):
+        """Serve newline-delimited JSON requests; reply with one JSON line each."""
+
+        def handle(self) -> None:
+            for line in self.rfile:
+                status: list[str] = []
+                try:
+                    reply = {"stdout": _handle_request(json.loads(line), status)}
+                except (GitHubError, subprocess.CalledProcessError) as e:
+                    reply = {"error": _describe_error(e)}
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {"error": f"bad request: {e}"}
+                except Exception as e:
+                    # Always answer: a client left without a reply would rerun the operation itself
+                    reply = {"error": f"{type(e).__name__}: {e}"}
+                # Status lines written before a failure are still shown, as in a standalone run
+                reply["stderr"] = status
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+                self.wfile.flush()
+
+    class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    path = _socket_path()
+    if _forward_to_daemon({"op": "ping"}) is not None:
+        print(f"Error: a pr-assets daemon is already listening on {path}.", file=sys.stderr)
+        sys.exit(1)
     try:
-        result = subprocess.run(
-            ["gh", "pr", "edit", pr_number, "--body-file", tmp_path],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"Error: gh pr edit failed: {result.stderr}", file=sys.stderr)
-            sys.exit(1)
+        path.unlink()  # stale socket left by a daemon that did not shut down cleanly
+    except FileNotFoundError:
+        pass
+
+    # The daemon acts with the user's GitHub token: only the user may connect
+    old_umask = os.umask(0o077)
+    try:
+        server = _DaemonServer(str(path), _DaemonHandler)
+    finally:
+        os.umask(old_umask)
+
+    get_repo()
+    _gh_token()
+    _emit(f"pr-assets daemon listening on {path} (Ctrl-C to stop).", sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
     finally:
-        os.unlink(tmp_path)
+        server.server_close()
+        path.unlink(missing_ok=True)
+
 
-    print(f"PR #{pr_number} description updated with {len(entries)} screenshot(s).")
+def _forward_to_daemon(request: dict) -> Optional[dict]:
+    """Send a request to this checkout's daemon; None when no daemon is listening.
+
+    Only a socket owned by the current user is used: without XDG_RUNTIME_DIR
+    the path is predictable in the shared temp dir. Once connected, a missing
+    or broken reply is an error rather than a reason to run standalone.
+    """
+    path = _socket_path()
+    try:
+        if path.stat().st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None  # stale socket file: the daemon is gone
+        try:
+            sock.sendall((json.dumps(request) + "\n").encode())
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except OSError as e:
+            raise GitHubError(f"pr-assets daemon on {path} failed: {e}") from e
+    if not line:
+        raise GitHubError(f"pr-assets daemon on {path} closed the connection without replying")
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise GitHubError(f"pr-assets daemon on {path} sent an invalid reply") from e
+
+
+def _run_via_daemon(request: dict) -> bool:
+    """Forward request to a running daemon and print its output. False if there is none."""
+    reply = _forward_to_daemon(request)
+    if reply is None:
+        return False
+    for line in reply.get("stderr", []):
+        _emit(line, sys.stderr)
+    if "error" in reply:
+        raise GitHubError(reply["error"])
+    for line in reply.get("stdout", []):
+        _emit(line)
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -229,7 +1116,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="GitHub pr-assets upload helper for the pr-screenshots skill.",
     )
-    parser.add_argument("filepath", nargs="?", help="Image file to upload.")
+    parser.add_argument(
+        "filepaths",
+        nargs="*",
+        metavar="filepath",
+        help="Image file(s) to upload. Several files are uploaded in a single commit.",
+    )
     parser.add_argument(
         "--setup",
         action="store_true",
@@ -256,13 +1148,48 @@ def main() -> None:
         metavar="LABEL",
         help="Label-only entry for pending mode (repeatable). Used with --update-pr --pending.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the local repo/branch and PR body caches for this run (also skips the daemon).",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Serve uploads and PR updates for this checkout over a Unix socket until interrupted.",
+    )
     args = parser.parse_args()
 
+    global CACHE_ENABLED
+    CACHE_ENABLED = not args.no_cache
+
+    try:
+        run(args, parser)
+    except (GitHubError, subprocess.CalledProcessError) as e:
+        print(f"Error: {_describe_error(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _describe_error(error: Exception) -> str:
+    if isinstance(error, subprocess.CalledProcessError):
+        return f"`{' '.join(error.cmd[:3])}` failed:\n{_gh_stderr(error)}"
+    return str(error)
+
+
+def run(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    # --daemon
+    if args.daemon:
+        serve_daemon()
+        return
+
+    # Upload and --update-pr go through a running daemon when there is one
+    use_daemon = not args.no_cache
+
     # --setup
     if args.setup:
         repo = get_repo()
         if branch_exists(repo, "pr-assets"):
-            print(f"Branch 'pr-assets' already exists in {repo}. Nothing to do.")
+            _emit(f"Branch 'pr-assets' already exists in {repo}. Nothing to do.", sys.stderr)
         else:
             create_pr_assets_branch(repo)
         return
@@ -273,32 +1200,33 @@ def main() -> None:
             if not args.labels:
                 print("Error: --update-pr --pending requires at least one --label LABEL.", file=sys.stderr)
                 sys.exit(1)
-            update_pr(args.update_pr, [(label, "") for label in args.labels])
-            return
-        if not args.entries:
+            entries = [(label, "") for label in args.labels]
+        elif not args.entries:
             print("Error: --update-pr requires at least one --entry LABEL URL pair.", file=sys.stderr)
             sys.exit(1)
-        update_pr(args.update_pr, [(label, url) for label, url in args.entries])
+        else:
+            entries = [(label, url) for label, url in args.entries]
+        request = {"op": "update_pr", "number": args.update_pr, "entries": entries}
+        if not (use_daemon and _run_via_daemon(request)):
+            _emit(update_pr(args.update_pr, entries), sys.stderr)
         return
 
-    # Upload single file
-    if not args.filepath:
+    # Upload file(s)
+    if not args.filepaths:
         parser.print_help()
         sys.exit(1)
 
-    if not os.path.exists(args.filepath):
-        print(f"Error: file not found: {args.filepath}", file=sys.stderr)
-        sys.exit(1)
-
-    repo = get_repo()
+    for filepath in args.filepaths:
+        if not os.path.exists(filepath):
+            print(f"Error: file not found: {filepath}", file=sys.stderr)
+            sys.exit(1)
 
-    # Auto-create the branch if it doesn't exist yet
-    if not branch_exists(repo, "pr-assets"):
-        print(f"Branch 'pr-assets' not found in {repo}. Creating it automatically...")
-        create_pr_assets_branch(repo)
+    request = {"op": "upload", "paths": [os.path.abspath(filepath) for filepath in args.filepaths]}
+    if use_daemon and _run_via_daemon(request):
+        return
 
-    url = upload_to_github(args.filepath, repo)
-    print(json.dumps({"url": url}))
+    for url in upload_files(args.filepaths, get_repo()):
+        _emit(json.dumps({"url": url}))
 
 
 if __name__ == "__main__":